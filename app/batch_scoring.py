@@ -0,0 +1,108 @@
+"""
+Streamlit-free helpers for batch risk scoring of uploaded call lists.
+
+Kept separate from streamlit_app.py so they can be imported (and tested)
+without running the UI. Nothing here touches ``st.*``: the batch loop runs
+requests in worker threads, which have no Streamlit script context.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator, Optional, Tuple
+
+import pandas as pd
+import requests
+
+REQUIRED_COLS = ["caller", "callee", "hour_of_day", "pct_answered_last_7d"]
+CSV_DTYPES = {"caller": str, "callee": str}
+ERROR_LABEL = "error"
+
+
+class ApiError(RuntimeError):
+    pass
+
+
+def call_api(
+    session: requests.Session, method: str, url: str, timeout: float, **kwargs
+) -> dict:
+    r = session.request(method, url, timeout=timeout, **kwargs)
+    if not r.ok:
+        # Raising keeps failures out of st.cache_data.
+        raise ApiError(f"Error {r.status_code}: {r.text[:300]}")
+    return r.json()
+
+
+def score_batch(
+    session: requests.Session, api_base: str, calls: list[dict]
+) -> list[dict]:
+    out = call_api(
+        session,
+        "POST",
+        f"{api_base}/predict_call_risk/batch",
+        120,
+        json={"calls": calls},
+    )
+    return out["results"]
+
+
+def chunk_records(chunk: pd.DataFrame) -> list[dict]:
+    # Drop blank cells so the API's defaults apply instead of NaN.
+    return [
+        {k: v for k, v in row.items() if not pd.isna(v)}
+        for row in chunk.to_dict("records")
+    ]
+
+
+def count_records(upload, chunksize: int = 10_000) -> int:
+    """Count CSV records (not lines: quoted fields may contain newlines)."""
+    total = sum(len(c) for c in pd.read_csv(upload, usecols=[0], chunksize=chunksize))
+    upload.seek(0)
+    return total
+
+
+def iter_scored_batches(
+    session: requests.Session,
+    api_base: str,
+    upload,
+    batch_size: int,
+    max_workers: int = 4,
+) -> Iterator[Tuple[pd.DataFrame, Optional[str]]]:
+    """
+    Yield ``(chunk, error)`` per batch, in completion order.
+
+    Each chunk gets ``risk_score`` / ``risk_label`` columns. A failed batch
+    is still yielded, with NaN scores and label ``"error"``, so no rows go
+    missing. At most ``max_workers`` batches are in flight; the next chunk
+    is read only when one completes.
+    """
+    reader = pd.read_csv(upload, chunksize=batch_size, dtype=CSV_DTYPES)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {}
+
+        def submit_next() -> None:
+            chunk = next(reader, None)
+            if chunk is None:
+                return
+            missing = [c for c in REQUIRED_COLS if c not in chunk.columns]
+            if missing:
+                raise ApiError(f"CSV is missing columns: {', '.join(missing)}")
+            fut = pool.submit(score_batch, session, api_base, chunk_records(chunk))
+            pending[fut] = chunk
+
+        for _ in range(max_workers):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                chunk = pending.pop(fut)
+                try:
+                    results = fut.result()
+                except (ApiError, requests.RequestException) as e:
+                    yield chunk.assign(
+                        risk_score=float("nan"), risk_label=ERROR_LABEL
+                    ), str(e)
+                else:
+                    yield chunk.assign(
+                        risk_score=[r["risk_score"] for r in results],
+                        risk_label=[r["risk_label"] for r in results],
+                    ), None
+                submit_next()
@@ -1,13 +1,121 @@
 import os
 
+import numpy as np
+import pandas as pd
 import requests
 import streamlit as st
+from batch_scoring import (
+    ERROR_LABEL,
+    REQUIRED_COLS,
+    ApiError,
+    call_api,
+    count_records,
+    iter_scored_batches,
+)
+from requests.adapters import HTTPAdapter
 
 API_BASE_DEFAULT = os.getenv("API_BASE_URL", "http://localhost:8000")
+# Parallel batch requests in flight; also the connection-pool size.
+MAX_WORKERS = int(os.getenv("UI_MAX_WORKERS", "4"))
+CACHE_TTL_SEC = 600
+HIST_BINS = np.linspace(0.0, 1.0, 21)
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """One pooled keep-alive session per Streamlit server process.
+
+    Shared across user sessions and batch worker threads. That is safe here
+    because nothing per-user lives on it (no auth headers; the API sets no
+    cookies), and the underlying urllib3 connection pool is thread-safe.
+    """
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=MAX_WORKERS, max_retries=2)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+@st.cache_data(ttl=CACHE_TTL_SEC, show_spinner=False)
+def score_call(api_base: str, payload: dict) -> dict:
+    return call_api(
+        get_session(), "POST", f"{api_base}/predict_call_risk", 60, json=payload
+    )
+
+
+@st.cache_data(ttl=CACHE_TTL_SEC, show_spinner=False)
+def run_triage(api_base: str, complaint: str, meta: dict) -> dict:
+    return call_api(
+        get_session(),
+        "POST",
+        f"{api_base}/triage",
+        120,
+        json={"complaint_text": complaint, "meta": meta},
+    )
+
+
+@st.cache_data(ttl=CACHE_TTL_SEC, show_spinner=False)
+def search_kb(api_base: str, q: str, k: int = 5) -> list[dict]:
+    out = call_api(
+        get_session(), "GET", f"{api_base}/rag/search", 60, params={"q": q, "k": k}
+    )
+    return out.get("results", [])
+
+
+def _render_histogram(placeholder, scores: list[float]) -> None:
+    counts, _ = np.histogram(scores, bins=HIST_BINS)
+    labels = [f"{lo:.2f}" for lo in HIST_BINS[:-1]]
+    placeholder.bar_chart(pd.DataFrame({"calls": counts}, index=labels))
+
+
+def score_csv(api_base: str, upload, batch_size: int) -> tuple[pd.DataFrame, int]:
+    """Stream the CSV through the batch API, updating a live histogram.
+
+    Returns every uploaded row (failed batches labelled "error") and the
+    number of rows that could not be scored.
+    """
+    total = count_records(upload)
+    progress = st.progress(0.0, text="Scoring…")
+    hist = st.empty()
+    chunks, scores, errors = [], [], []
+    failed = 0
+    for chunk, error in iter_scored_batches(
+        get_session(), api_base, upload, batch_size, max_workers=MAX_WORKERS
+    ):
+        chunks.append(chunk)
+        if error:
+            errors.append(error)
+            failed += len(chunk)
+        else:
+            scores.extend(chunk["risk_score"])
+            _render_histogram(hist, scores)
+        done = len(scores) + failed
+        progress.progress(
+            min(done / total, 1.0) if total else 1.0,
+            text=f"Scored {len(scores)} / {total} calls ({failed} failed)",
+        )
+    progress.progress(
+        1.0, text=f"Scored {len(scores)} / {total} calls ({failed} failed)"
+    )
+    for e in errors:
+        st.error(e)
+    if not chunks:
+        return pd.DataFrame(), failed
+    return pd.concat(chunks).sort_index(), failed
+
+
+def _clear_batch_results() -> None:
+    for key in ("batch_key", "batch_scored", "batch_failed"):
+        st.session_state.pop(key, None)
+
+
 st.set_page_config(page_title="TS-Guard", layout="wide")
 st.title("TS-Guard: Telco Scam Early‑Warning & Triage")
 with st.sidebar:
-    API_BASE = st.text_input("API Base URL", API_BASE_DEFAULT)
+    API_BASE = st.text_input("API Base URL", API_BASE_DEFAULT).rstrip("/")
+    if st.button("Clear cached results"):
+        st.cache_data.clear()
+        _clear_batch_results()
 tabs = st.tabs(["📊 Risk Monitor", "🛟 Agent Triage", "📚 Knowledge Search"])
 with tabs[0]:
     st.subheader("Quick Risk Score")
@@ -33,12 +141,53 @@ with tabs[0]:
             "pct_answered_last_7d": pct_ans7,
             "complaints_last_7d": complaints7,
         }
-        r = requests.post(f"{API_BASE}/predict_call_risk", json=payload, timeout=60)
-        if r.ok:
-            data = r.json()
+        try:
+            data = score_call(API_BASE, payload)
             st.metric("Risk Score", f"{data['risk_score']:.2f}", data["risk_label"])
-        else:
-            st.error(f"Error {r.status_code}: {r.text[:300]}")
+        except (ApiError, requests.RequestException) as e:
+            st.error(str(e))
+
+    st.divider()
+    st.subheader("Batch Risk Upload (CSV)")
+    st.caption(
+        "Columns: " + ", ".join(REQUIRED_COLS) + " (required); other call "
+        "fields are optional and fall back to API defaults."
+    )
+    upload = st.file_uploader("Call list", type=["csv"])
+    batch_size = st.select_slider(
+        "Rows per request", options=[50, 100, 200, 500, 1000], value=200
+    )
+    # Batch scoring runs in worker threads, so it is cached here in the
+    # script thread: re-clicking with the same file/API/batch size reuses a
+    # fully successful run. Partial runs are rescored on the next click.
+    batch_key = (upload.file_id, API_BASE, batch_size) if upload else None
+    if upload is not None and st.button("Score file"):
+        if st.session_state.get("batch_key") != batch_key:
+            _clear_batch_results()
+            try:
+                scored, failed = score_csv(API_BASE, upload, batch_size)
+            except (ApiError, ValueError) as e:
+                st.error(str(e))
+            else:
+                st.session_state["batch_scored"] = scored
+                st.session_state["batch_failed"] = failed
+                if failed == 0:
+                    st.session_state["batch_key"] = batch_key
+    scored = st.session_state.get("batch_scored")
+    if scored is not None and not scored.empty:
+        failed = st.session_state.get("batch_failed", 0)
+        if failed:
+            st.warning(
+                f"{failed} of {len(scored)} rows could not be scored; they are "
+                f"kept with risk_label '{ERROR_LABEL}'. Click Score file to retry."
+            )
+        st.dataframe(scored.sort_values("risk_score", ascending=False))
+        st.download_button(
+            "Download scored CSV",
+            scored.to_csv(index=False).encode("utf-8"),
+            file_name="scored_calls.csv",
+            mime="text/csv",
+        )
 
 with tabs[1]:
     st.subheader("LLM‑powered Triage (EN + BM)")
@@ -59,26 +208,20 @@ with tabs[1]:
         "complaints_last_7d": 1,
     }
     if st.button("Run Triage"):
-        r = requests.post(
-            f"{API_BASE}/triage",
-            json={"complaint_text": complaint, "meta": meta},
-            timeout=120,
-        )
-        if r.ok:
-            out = r.json()
+        try:
+            out = run_triage(API_BASE, complaint, meta)
             st.json(out["triage"])
             st.caption(f"Detected language: {out.get('language','n/a')}")
-        else:
-            st.error(f"Error {r.status_code}: {r.text[:300]}")
+        except (ApiError, requests.RequestException) as e:
+            st.error(str(e))
 
 with tabs[2]:
     st.subheader("Search internal KB")
     q = st.text_input("Query", "tac code scam escalation")
     if st.button("Search"):
-        r = requests.get(f"{API_BASE}/search_kb", params={"q": q}, timeout=60)
-        if r.ok:
-            for item in r.json().get("results", []):
+        try:
+            for item in search_kb(API_BASE, q):
                 st.write("•", item["snippet"])
                 st.caption(item.get("source", "kb"))
-        else:
-            st.error(f"Error {r.status_code}: {r.text[:300]}")
+        except (ApiError, requests.RequestException) as e:
+            st.error(str(e))
@@ -0,0 +1,62 @@
+"""
+Report where import time goes for a module (default: ts_guard.api.main).
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter and
+prints the slowest entries by cumulative time.
+
+    python scripts/importtime_report.py
+    python scripts/importtime_report.py ts_guard.api.rag_qa --top 40 --self
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """Return (self_us, cumulative_us, module) rows from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        rows.append((int(parts[0]), int(parts[1]), parts[2].rstrip()))
+    return rows
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("module", nargs="?", default="ts_guard.api.main")
+    ap.add_argument("--top", type=int, default=25, help="rows to show")
+    ap.add_argument(
+        "--self", action="store_true", help="sort by self time, not cumulative"
+    )
+    args = ap.parse_args(argv)
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {args.module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        print(proc.stderr, file=sys.stderr)
+        return proc.returncode
+
+    rows = parse_importtime(proc.stderr)
+    top = next((r for r in rows if r[2].strip() == args.module), None)
+    rows.sort(key=lambda r: r[0] if args.self else r[1], reverse=True)
+
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for self_us, cum_us, name in rows[: args.top]:
+        print(f"{self_us / 1000:9.1f} {cum_us / 1000:9.1f}  {name}")
+    print()
+    print(f"modules imported: {len(rows)}")
+    if top:
+        print(f"total for {args.module}: {top[1] / 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,5 @@
 import os
 
-import requests
-
 PROVIDER = os.getenv("LLM_PROVIDER", "openai").lower()
 MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")
 TIMEOUT = float(os.getenv("LLM_TIMEOUT_SEC", "60"))
@@ -23,6 +21,8 @@ def chat(messages, temperature=0.2, model=MODEL) -> str:
             )
         r.raise_for_status()
         return r.json()["choices"][0]["message"]["content"].strip()
+    import requests
+
     # Ollama chat
     try:
         resp = requests.post(
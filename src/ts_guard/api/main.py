@@ -4,18 +4,16 @@ from __future__ import annotations
 import importlib
 import importlib.util
 import os
+import warnings
 from functools import lru_cache
 
-import joblib
-import pandas as pd
-from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
-from .llm_provider import chat
-
-load_dotenv()
+# Heavy dependencies (pandas, joblib, numpy, dotenv, requests, RAG stack) are
+# imported inside the helpers below so that cold starts and /healthz only pay
+# for FastAPI + pydantic. tests/test_import_budget.py guards this.
 
 APP = FastAPI()
 APP.add_middleware(
@@ -29,8 +27,28 @@ APP.add_middleware(
 # ---------- Lazy helpers ----------
 
 
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env once, before any module that reads settings at import time."""
+    if importlib.util.find_spec("dotenv") is None:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def _get_chat():
+    """Import the LLM provider (and its HTTP clients) only when needed."""
+    _load_env()
+    from .llm_provider import chat
+
+    return chat
+
+
 def _get_rag():
     """Import RAG only when an endpoint needs it."""
+    _load_env()
     try:
         from .rag_qa import answer as rag_answer
         from .rag_qa import search as rag_search
@@ -63,6 +81,19 @@ def _detect_lang(text: str) -> str:
 # ---------- Model utilities ----------
 
 MODEL_PATH = os.path.join(os.path.dirname(__file__), "..", "ml", "model.joblib")
+# Fallback column order for models fitted without feature names (see
+# ml/features.py). Models trained on a DataFrame carry ``feature_names_in_``,
+# which takes precedence so a retrain with a new column order stays correct.
+FEATURES = (
+    "duration_sec",
+    "hour_of_day",
+    "is_outbound",
+    "recent_calls_from_caller_24h",
+    "pct_answered_last_7d",
+    "complaints_last_7d",
+)
+# Upper bound on calls per /predict_call_risk/batch request.
+MAX_BATCH = 1000
 _model = None
 
 
@@ -70,12 +101,33 @@ def _load_model():
     global _model
     if _model is None:
         try:
+            import joblib
+
             _model = joblib.load(MODEL_PATH)
         except Exception as e:
             raise HTTPException(status_code=503, detail=f"Model not available: {e}")
     return _model
 
 
+def _predict_proba(model, metas: list[CallMeta]):
+    """Score ``metas`` with rows laid out in the model's own feature order."""
+    import numpy as np
+
+    names = [str(f) for f in getattr(model, "feature_names_in_", FEATURES)]
+    unknown = [f for f in names if f not in CallMeta.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Model expects unknown features: {', '.join(unknown)}",
+        )
+    X = np.array([[float(getattr(m, f)) for f in names] for m in metas])
+    with warnings.catch_warnings():
+        # Columns follow feature_names_in_ by construction; sklearn only
+        # complains that a bare array carries no names to compare.
+        warnings.filterwarnings("ignore", message="X does not have valid feature names")
+        return model.predict_proba(X)[:, 1]
+
+
 # ---------- Schemas ----------
 
 
@@ -96,6 +148,14 @@ class RiskResponse(BaseModel):
     risk_label: str
 
 
+class CallBatch(BaseModel):
+    calls: list[CallMeta] = Field(..., min_length=1, max_length=MAX_BATCH)
+
+
+class RiskBatchResponse(BaseModel):
+    results: list[RiskResponse]
+
+
 class TriageRequest(BaseModel):
     complaint_text: str
     meta: CallMeta | None = None
@@ -126,26 +186,27 @@ def health():
 @APP.post("/predict_call_risk", response_model=RiskResponse)
 def predict_call_risk(meta: CallMeta):
     model = _load_model()
-    df = pd.DataFrame([meta.model_dump()])
-    X = df[
-        [
-            "duration_sec",
-            "hour_of_day",
-            "is_outbound",
-            "recent_calls_from_caller_24h",
-            "pct_answered_last_7d",
-            "complaints_last_7d",
-        ]
-    ].astype({"is_outbound": int})
-    proba = float(model.predict_proba(X)[0, 1])
+    proba = float(_predict_proba(model, [meta])[0])
     return {"risk_score": proba, "risk_label": risk_label_from_proba(proba)}
 
 
+@APP.post("/predict_call_risk/batch", response_model=RiskBatchResponse)
+def predict_call_risk_batch(batch: CallBatch):
+    model = _load_model()
+    probas = _predict_proba(model, batch.calls)
+    return {
+        "results": [
+            {"risk_score": float(p), "risk_label": risk_label_from_proba(float(p))}
+            for p in probas
+        ]
+    }
+
+
 @APP.post("/triage")
 def triage(req: TriageRequest):
     rag_answer, _ = _get_rag()
     lang = _detect_lang(req.complaint_text)
-    out = rag_answer(req.complaint_text, lang_hint=lang, chat_fn=chat)
+    out = rag_answer(req.complaint_text, lang_hint=lang, chat_fn=_get_chat())
     try:
         tri = TriageJSON.model_validate(out).model_dump()
     except Exception:
@@ -168,4 +229,4 @@ def rag_search_endpoint(q: str, k: int = 5):
 def rag_answer_endpoint(q: str, k: int = 3):
     rag_answer, _ = _get_rag()
     lang = _detect_lang(q)
-    return {"answer": rag_answer(q, k=k, lang_hint=lang, chat_fn=chat)}
+    return {"answer": rag_answer(q, k=k, lang_hint=lang, chat_fn=_get_chat())}
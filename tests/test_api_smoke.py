@@ -8,3 +8,54 @@ def test_healthz():
     r = c.get("/healthz")
     assert r.status_code == 200
     assert r.json().get("ok") is True
+
+
+class _DurationModel:
+    """Stub scorer: risk is duration_sec / 100, so row order is checkable."""
+
+    def predict_proba(self, X):
+        import numpy as np
+
+        p = X[:, 0] / 100.0
+        return np.column_stack([1 - p, p])
+
+
+def test_predict_call_risk_batch(monkeypatch):
+    import ts_guard.api.main as api
+
+    monkeypatch.setattr(api, "_model", _DurationModel())
+    base = {"caller": "+60123456789", "callee": "+60388888888", "hour_of_day": 10}
+    calls = [
+        {**base, "duration_sec": d, "pct_answered_last_7d": 0.5} for d in (10, 50, 90)
+    ]
+    r = TestClient(APP).post("/predict_call_risk/batch", json={"calls": calls})
+    assert r.status_code == 200
+    results = r.json()["results"]
+    assert [round(x["risk_score"], 2) for x in results] == [0.1, 0.5, 0.9]
+    assert [x["risk_label"] for x in results] == ["low", "medium", "high"]
+
+
+class _NamedModel(_DurationModel):
+    """Fitted-on-DataFrame stub whose columns differ from the fallback order."""
+
+    feature_names_in_ = ["complaints_last_7d", "duration_sec"]
+
+    def predict_proba(self, X):
+        return super().predict_proba(X[:, 1:])
+
+
+def test_predict_call_risk_uses_model_feature_order(monkeypatch):
+    import ts_guard.api.main as api
+
+    monkeypatch.setattr(api, "_model", _NamedModel())
+    call = {
+        "caller": "+60123456789",
+        "callee": "+60388888888",
+        "hour_of_day": 10,
+        "duration_sec": 80,
+        "pct_answered_last_7d": 0.5,
+        "complaints_last_7d": 3,
+    }
+    r = TestClient(APP).post("/predict_call_risk", json=call)
+    assert r.status_code == 200
+    assert round(r.json()["risk_score"], 2) == 0.8
@@ -0,0 +1,78 @@
+import io
+import math
+
+import pandas as pd
+import pytest
+
+from app.batch_scoring import ApiError, count_records, iter_scored_batches
+
+CSV = (
+    "caller,callee,hour_of_day,pct_answered_last_7d,complaints_last_7d\n"
+    "+60100,+60300,1,0.1,2\n"
+    "+60101,+60301,2,0.2,\n"
+    "+60102,+60302,3,0.3,1\n"
+    "BAD,+60303,4,0.4,0\n"
+    "+60104,+60304,5,0.5,\n"
+)
+
+
+class _Response:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self._payload = payload
+        self.text = str(payload)
+
+    def json(self):
+        return self._payload
+
+
+class _StubSession:
+    """Scores hour_of_day / 10; rejects any batch containing caller "BAD"."""
+
+    def __init__(self):
+        self.batches = []
+
+    def request(self, method, url, timeout, json):
+        calls = json["calls"]
+        self.batches.append(calls)
+        if any(c["caller"] == "BAD" for c in calls):
+            return _Response(422, {"detail": "bad caller"})
+        results = [
+            {"risk_score": c["hour_of_day"] / 10, "risk_label": "low"} for c in calls
+        ]
+        return _Response(200, {"results": results})
+
+
+def test_iter_scored_batches_keeps_failed_rows():
+    session = _StubSession()
+    out = list(
+        iter_scored_batches(
+            session, "http://api", io.StringIO(CSV), batch_size=2, max_workers=2
+        )
+    )
+    errors = [e for _, e in out if e]
+    df = pd.concat(c for c, _ in out).sort_index()
+
+    assert len(df) == 5
+    assert len(errors) == 1 and "422" in errors[0]
+    assert list(df["caller"]) == ["+60100", "+60101", "+60102", "BAD", "+60104"]
+    assert list(df["risk_label"]) == ["low", "low", "error", "error", "low"]
+    assert df["risk_score"].iloc[0] == pytest.approx(0.1)
+    assert math.isnan(df["risk_score"].iloc[3])
+    # Blank optional cells are dropped so the API default applies.
+    sent = {c["caller"]: c for batch in session.batches for c in batch}
+    assert "complaints_last_7d" not in sent["+60101"]
+    assert sent["+60100"]["complaints_last_7d"] == 2
+
+
+def test_iter_scored_batches_rejects_missing_columns():
+    upload = io.StringIO("caller,callee\n+60100,+60300\n")
+    with pytest.raises(ApiError, match="hour_of_day"):
+        list(iter_scored_batches(_StubSession(), "http://api", upload, 10))
+
+
+def test_count_records_ignores_quoted_newlines():
+    upload = io.StringIO('caller,note\n+60100,"two\nlines"\n+60101,x\n')
+    assert count_records(upload) == 2
+    assert upload.read().startswith("caller")
@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Wall-clock limit is generous so shared CI runners don't flake; tighten via env.
+MAX_IMPORT_SEC = float(os.getenv("TS_GUARD_MAX_IMPORT_SEC", "2.0"))
+# Modules main may add on top of bare fastapi + pydantic. Measured ~30
+# (ts_guard itself, pickle, and pydantic.v1 pulled in by route setup); the
+# rest is headroom. Counting relative to the framework keeps FastAPI and
+# Starlette upgrades from tripping this.
+MAX_EXTRA_MODULES = int(os.getenv("TS_GUARD_MAX_EXTRA_MODULES", "60"))
+
+HEAVY_MODULES = (
+    "pandas",
+    "numpy",
+    "joblib",
+    "sklearn",
+    "dotenv",
+    "requests",
+    "ts_guard.api.llm_provider",
+    "ts_guard.api.rag_qa",
+)
+
+_PROBE = f"""
+import json, sys, time
+import fastapi, fastapi.middleware.cors, pydantic
+framework = set(sys.modules)
+t0 = time.perf_counter()
+import ts_guard.api.main
+elapsed = time.perf_counter() - t0
+print(json.dumps({{
+    "elapsed": elapsed,
+    "extra_modules": sorted(set(sys.modules) - framework),
+    "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+@pytest.fixture(scope="module")
+def import_stats() -> dict:
+    # Fresh interpreter: pytest and conftest have already imported plenty.
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_api_import_skips_heavy_modules(import_stats):
+    assert import_stats["heavy"] == []
+
+
+def test_api_import_budget(import_stats):
+    extra = import_stats["extra_modules"]
+    assert len(extra) <= MAX_EXTRA_MODULES, extra
+    assert import_stats["elapsed"] <= MAX_IMPORT_SEC, import_stats["elapsed"]